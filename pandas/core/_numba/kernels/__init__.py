@@ -8,6 +8,7 @@ from pandas.core._numba.kernels.min_max_ import (
 )
 from pandas.core._numba.kernels.sum_ import (
     grouped_sum,
+    masked_sum,
     sliding_sum,
 )
 from pandas.core._numba.kernels.var_ import (
@@ -20,6 +21,7 @@ __all__ = [
     "grouped_mean",
     "sliding_sum",
     "grouped_sum",
+    "masked_sum",
     "sliding_var",
     "grouped_var",
     "sliding_min_max",
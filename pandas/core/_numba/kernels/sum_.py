@@ -243,3 +243,16 @@ def grouped_sum(
         output[lab] = result
 
     return output, na_pos
+
+
+@numba.jit(nopython=True, nogil=True, parallel=True)
+def masked_sum(values: np.ndarray, mask: npt.NDArray[np.bool_]) -> Any:
+    # Reduce over the unmasked values in parallel chunks; avoids materializing
+    # the inverted mask that np.sum(values, where=~mask) requires.
+    # Only used for integer input: the uncompensated float reduction would
+    # depend on the thread count (see add_sum for the Kahan variant)
+    sum_x = values.dtype.type(0)
+    for i in numba.prange(len(values)):
+        if not mask[i]:
+            sum_x += values[i]
+    return sum_x
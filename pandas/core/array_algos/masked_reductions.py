@@ -13,6 +13,7 @@ import numpy as np
 from pandas._libs import missing as libmissing
 
 from pandas.core.nanops import check_below_min_count
+from pandas.core.util.numba_ import maybe_use_numba
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -22,6 +23,10 @@ if TYPE_CHECKING:
         npt,
     )
 
+# minimum array length for dispatching ``sum`` to the parallel numba kernel;
+# below this the thread startup (and first-call JIT) outweighs the gain
+_NUMBA_MIN_ELEMENTS = 1_000_000
+
 
 def _reductions(
     func: Callable,
@@ -77,6 +82,24 @@ def sum(
     min_count: int = 0,
     axis: AxisInt | None = None,
 ):
+    if (
+        skipna
+        and values.ndim == 1
+        and values.dtype == np.int64
+        and len(values) >= _NUMBA_MIN_ELEMENTS
+        and maybe_use_numba(None)
+    ):
+        # with compute.use_numba enabled, reduce large 1D arrays with a
+        # multithreaded kernel that releases the GIL. Restricted to int64,
+        # where the result is exact regardless of how the work is split;
+        # floats keep NumPy's pairwise summation
+        if check_below_min_count(values.shape, mask, min_count):
+            return libmissing.NA
+
+        from pandas.core._numba.kernels import masked_sum
+
+        return values.dtype.type(masked_sum(values, mask))
+
     return _reductions(
         np.sum, values=values, mask=mask, skipna=skipna, min_count=min_count, axis=axis
     )
@@ -53,25 +53,35 @@ def kleene_or(
 
     raise_for_nan(right, method="or")
 
+    if right is True:
+        # x | True is True everywhere and never NA; skip the element-wise op
+        return np.ones(left.shape, dtype=bool), np.zeros(left.shape, dtype=bool)
+
     if right is libmissing.NA:
         result = left.copy()
     else:
         result = left | right
 
     if right_mask is not None:
-        # output is unknown where (False & NA), (NA & False), (NA & NA)
-        left_false = ~(left | left_mask)
-        right_false = ~(right | right_mask)
-        mask = (
-            (left_false & right_mask)
-            | (right_false & left_mask)
-            | (left_mask & right_mask)
-        )
+        # output is unknown where (False & NA), (NA & False), (NA & NA);
+        # evaluated in place to avoid allocating a temporary per term
+        # a mask is only passed alongside an array
+        assert isinstance(right, np.ndarray)
+        left_false = np.logical_or(left, left_mask)
+        np.logical_not(left_false, out=left_false)
+        right_false = np.logical_or(right, right_mask)
+        np.logical_not(right_false, out=right_false)
+
+        mask = np.logical_and(left_false, right_mask)
+        tmp = np.logical_and(right_false, left_mask, out=left_false)
+        np.logical_or(mask, tmp, out=mask)
+        np.logical_and(left_mask, right_mask, out=tmp)
+        np.logical_or(mask, tmp, out=mask)
     else:
-        if right is True:
-            mask = np.zeros_like(left_mask)
-        elif right is libmissing.NA:
-            mask = (~left & ~left_mask) | left_mask
+        if right is libmissing.NA:
+            # unknown unless left is a known True
+            mask = np.logical_not(left)
+            np.logical_or(mask, left_mask, out=mask)
         else:
             # False
             mask = left_mask.copy()
@@ -166,6 +176,10 @@ def kleene_and(
         raise TypeError("Either `left` or `right` need to be a np.ndarray.")
     raise_for_nan(right, method="and")
 
+    if right is False:
+        # x & False is False everywhere and never NA; skip the element-wise op
+        return np.zeros(left.shape, dtype=bool), np.zeros(left.shape, dtype=bool)
+
     if right is libmissing.NA:
         result = np.zeros_like(left)
     else:
@@ -174,18 +188,21 @@ def kleene_and(
     if right_mask is None:
         # Scalar `right`
         if right is libmissing.NA:
-            mask = (left & ~left_mask) | left_mask
+            # unknown unless left is a known False
+            mask = np.logical_or(left, left_mask)
 
         else:
             mask = left_mask.copy()
-            if right is False:
-                # unmask everything
-                mask[:] = False
     else:
-        # unmask where either left or right is False
-        left_false = ~(left | left_mask)
-        right_false = ~(right | right_mask)
-        mask = (left_mask & ~right_false) | (right_mask & ~left_false)
+        # unmask where either left or right is False, i.e.
+        # (left_mask & ~right_false) | (right_mask & ~left_false),
+        # evaluated in place to avoid allocating a temporary per term
+        assert isinstance(right, np.ndarray)
+        mask = np.logical_or(right, right_mask)
+        np.logical_and(mask, left_mask, out=mask)
+        tmp = np.logical_or(left, left_mask)
+        np.logical_and(tmp, right_mask, out=tmp)
+        np.logical_or(mask, tmp, out=mask)
 
     return result, mask
 
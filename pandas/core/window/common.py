@@ -24,6 +24,26 @@ def flex_binary_moment(arg1, arg2, f, pairwise: bool = False):
         from pandas import DataFrame
 
         def dataframe_from_int_dict(data, frame_template) -> DataFrame:
+            index = frame_template.index
+            columns = list(data.values())
+            if columns and all(
+                isinstance(col, ABCSeries)
+                and col.index is index
+                and col.dtype == np.float64
+                for col in columns
+            ):
+                # Results are already aligned with the template, so fill a
+                # preallocated 2D block instead of aligning a dict of Series
+                values = np.empty((len(columns), len(index)), dtype=np.float64)
+                for i, col in enumerate(columns):
+                    values[i] = col._values
+                return DataFrame(
+                    values.T,
+                    index=index,
+                    columns=frame_template.columns[list(data)],
+                    copy=False,
+                )
+
             result = DataFrame(data, index=frame_template.index)
             if len(result.columns) > 0:
                 result.columns = frame_template.columns[result.columns]
@@ -53,6 +73,16 @@ def flex_binary_moment(arg1, arg2, f, pairwise: bool = False):
                     return DataFrame(results, index=X.index, columns=res_columns)
             elif pairwise is True:
                 results = defaultdict(dict)
+                # Hoist the per-column part of prep_binary out of the pairwise
+                # loop: each column and its ``0 * column`` NaN-mask are
+                # computed once instead of once per (i, j) pair
+                left = [arg1.iloc[:, i] for i in range(len(arg1.columns))]
+                left_nan = [0 * col for col in left]
+                if arg2 is arg1:
+                    right, right_nan = left, left_nan
+                else:
+                    right = [arg2.iloc[:, j] for j in range(len(arg2.columns))]
+                    right_nan = [0 * col for col in right]
                 for i in range(len(arg1.columns)):
                     for j in range(len(arg2.columns)):
                         if j < i and arg2 is arg1:
@@ -60,7 +90,7 @@ def flex_binary_moment(arg1, arg2, f, pairwise: bool = False):
                             results[i][j] = results[j][i]
                         else:
                             results[i][j] = f(
-                                *prep_binary(arg1.iloc[:, i], arg2.iloc[:, j])
+                                left[i] + right_nan[j], right[j] + left_nan[i]
                             )
 
                 from pandas import concat
@@ -148,18 +178,10 @@ def flex_binary_moment(arg1, arg2, f, pairwise: bool = False):
 
 
 def zsqrt(x):
-    with np.errstate(all="ignore"):
-        result = np.sqrt(x)
-        mask = x < 0
-
-    if isinstance(x, ABCDataFrame):
-        if mask._values.any():
-            result[mask] = 0
-    else:
-        if mask.any():
-            result[mask] = 0
-
-    return result
+    # clip negative values (floating point noise from the variance
+    # computation) to 0 before taking the root, so sqrt only ever sees
+    # valid inputs and no separate mask/assign pass is needed
+    return np.sqrt(np.maximum(x, 0))
 
 
 def prep_binary(arg1, arg2):
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from io import StringIO
 from typing import TYPE_CHECKING
 import warnings
 
 from pandas._libs import lib
+from pandas.compat import (
+    pa_version_under10p1,
+    pa_version_under17p0,
+)
 from pandas.compat._optional import import_optional_dependency
 from pandas.errors import (
     ParserError,
@@ -14,13 +19,51 @@ from pandas.util._exceptions import find_stack_level
 from pandas.core.dtypes.common import pandas_dtype
 from pandas.core.dtypes.inference import is_integer
 
+from pandas import DataFrame
+from pandas.core.arrays import ArrowExtensionArray
+from pandas.core.indexes.api import (
+    Index,
+    default_index,
+)
+
 from pandas.io._util import arrow_table_to_pandas
+from pandas.io.common import _BytesIOWrapper
 from pandas.io.parsers.base_parser import ParserBase
 
+if not pa_version_under10p1:
+    import pyarrow as pa
+    import pyarrow.csv as pyarrow_csv
+
 if TYPE_CHECKING:
     from pandas._typing import ReadBuffer
 
-    from pandas import DataFrame
+
+def _skip_invalid_row(invalid_row) -> str:
+    return "skip"
+
+
+# read_csv keyword -> pyarrow.csv.ParseOptions / ConvertOptions attribute
+_PARSE_OPTION_NAMES = {
+    "delimiter": "delimiter",
+    "quotechar": "quote_char",
+    "escapechar": "escape_char",
+    "skip_blank_lines": "ignore_empty_lines",
+}
+_CONVERT_OPTION_NAMES = {
+    "usecols": "include_columns",
+    "na_values": "null_values",
+    "true_values": "true_values",
+    "false_values": "false_values",
+    "decimal": "decimal_point",
+}
+
+# pyarrow invalid_row_handler for the non-callable on_bad_lines options,
+# except WARN which needs the parser instance
+_INVALID_ROW_HANDLERS = {
+    # PyArrow raises an exception by default
+    ParserBase.BadLineHandleMethod.ERROR: None,
+    ParserBase.BadLineHandleMethod.SKIP: _skip_invalid_row,
+}
 
 
 class ArrowParserWrapper(ParserBase):
@@ -32,8 +75,13 @@ class ArrowParserWrapper(ParserBase):
         super().__init__(kwds)
         self.kwds = kwds
         self.src = src
+        # (expected_columns, actual_columns, text) of rows skipped with
+        # on_bad_lines="warn", reported once read_csv has returned
+        self._bad_rows: list[tuple[int, int, str]] = []
 
         self._parse_kwds()
+        self._get_pyarrow_options()
+        self._make_pyarrow_options()
 
     def _parse_kwds(self) -> None:
         """
@@ -49,97 +97,98 @@ class ArrowParserWrapper(ParserBase):
             )
         self.na_values = list(self.kwds["na_values"])
 
+        # Resolve dtypes up front so reading only has to filter by column
+        if isinstance(self.dtype, dict):
+            self.dtype = {k: pandas_dtype(v) for k, v in self.dtype.items()}
+        elif self.dtype is not None:
+            self.dtype = pandas_dtype(self.dtype)
+
     def _get_pyarrow_options(self) -> None:
         """
-        Rename some arguments to pass to pyarrow
+        Translate the read_csv keywords into pyarrow.csv option dicts
         """
-        mapping = {
-            "usecols": "include_columns",
-            "na_values": "null_values",
-            "escapechar": "escape_char",
-            "skip_blank_lines": "ignore_empty_lines",
-            "decimal": "decimal_point",
-            "quotechar": "quote_char",
-        }
-        for pandas_name, pyarrow_name in mapping.items():
-            if pandas_name in self.kwds and self.kwds.get(pandas_name) is not None:
-                self.kwds[pyarrow_name] = self.kwds.pop(pandas_name)
-
-        # Date format handling
-        # If we get a string, we need to convert it into a list for pyarrow
-        # If we get a dict, we want to parse those separately
-        date_format = self.date_format
-        if isinstance(date_format, str):
-            date_format = [date_format]
-        else:
-            # In case of dict, we don't want to propagate through, so
-            # just set to pyarrow default of None
-
-            # Ideally, in future we disable pyarrow dtype inference (read in as string)
-            # to prevent misreads.
-            date_format = None
-        self.kwds["timestamp_parsers"] = date_format
-
+        kwds = self.kwds
         self.parse_options = {
-            option_name: option_value
-            for option_name, option_value in self.kwds.items()
-            if option_value is not None
-            and option_name
-            in ("delimiter", "quote_char", "escape_char", "ignore_empty_lines")
+            pyarrow_name: kwds[pandas_name]
+            for pandas_name, pyarrow_name in _PARSE_OPTION_NAMES.items()
+            if kwds.get(pandas_name) is not None
         }
 
-        on_bad_lines = self.kwds.get("on_bad_lines")
+        on_bad_lines = kwds.get("on_bad_lines")
         if on_bad_lines is not None:
             if callable(on_bad_lines):
-                self.parse_options["invalid_row_handler"] = on_bad_lines
-            elif on_bad_lines == ParserBase.BadLineHandleMethod.ERROR:
-                self.parse_options["invalid_row_handler"] = (
-                    None  # PyArrow raises an exception by default
-                )
+                handler = on_bad_lines
             elif on_bad_lines == ParserBase.BadLineHandleMethod.WARN:
-
-                def handle_warning(invalid_row) -> str:
-                    warnings.warn(
-                        f"Expected {invalid_row.expected_columns} columns, but found "
-                        f"{invalid_row.actual_columns}: {invalid_row.text}",
-                        ParserWarning,
-                        stacklevel=find_stack_level(),
-                    )
-                    return "skip"
-
-                self.parse_options["invalid_row_handler"] = handle_warning
-            elif on_bad_lines == ParserBase.BadLineHandleMethod.SKIP:
-                self.parse_options["invalid_row_handler"] = lambda _: "skip"
+                handler = self._record_bad_row
+            else:
+                handler = _INVALID_ROW_HANDLERS.get(on_bad_lines)
+            self.parse_options["invalid_row_handler"] = handler
 
         self.convert_options = {
-            option_name: option_value
-            for option_name, option_value in self.kwds.items()
-            if option_value is not None
-            and option_name
-            in (
-                "include_columns",
-                "null_values",
-                "true_values",
-                "false_values",
-                "decimal_point",
-                "timestamp_parsers",
-            )
+            pyarrow_name: kwds[pandas_name]
+            for pandas_name, pyarrow_name in _CONVERT_OPTION_NAMES.items()
+            if kwds.get(pandas_name) is not None
         }
-        self.convert_options["strings_can_be_null"] = "" in self.kwds["null_values"]
+
+        # Date format handling
+        # If we get a string, we need to convert it into a list for pyarrow
+        # If we get a dict, we want to parse those separately, so we don't
+        # propagate it through and leave pyarrow's default of None
+
+        # Ideally, in future we disable pyarrow dtype inference (read in as string)
+        # to prevent misreads.
+        if isinstance(self.date_format, str):
+            self.convert_options["timestamp_parsers"] = [self.date_format]
+
+        self.convert_options["strings_can_be_null"] = "" in kwds["na_values"]
         # autogenerated column names are prefixed with 'f' in pyarrow.csv
         if self.header is None and "include_columns" in self.convert_options:
-            self.convert_options["include_columns"] = [
-                f"f{n}" for n in self.convert_options["include_columns"]
-            ]
+            self.convert_options["include_columns"] = list(
+                map("f{}".format, self.convert_options["include_columns"])
+            )
 
         self.read_options = {
             "autogenerate_column_names": self.header is None,
-            "skip_rows": self.header
-            if self.header is not None
-            else self.kwds["skiprows"],
+            "skip_rows": self.header if self.header is not None else kwds["skiprows"],
             "encoding": self.encoding,
         }
 
+    def _record_bad_row(self, invalid_row) -> str:
+        # Only record the row here; warning from inside the pyarrow callback
+        # would walk the stack once per bad line. See read().
+        self._bad_rows.append(
+            (invalid_row.expected_columns, invalid_row.actual_columns, invalid_row.text)
+        )
+        return "skip"
+
+    def _make_pyarrow_options(self) -> None:
+        """
+        Construct the pyarrow.csv option objects once, so they can be reused
+        by every call to ``read``.
+        """
+        # raises an informative ImportError if pyarrow is missing or too old
+        import_optional_dependency("pyarrow.csv")
+
+        try:
+            self._convert_options = pyarrow_csv.ConvertOptions(**self.convert_options)
+        except TypeError as err:
+            include = self.convert_options.get("include_columns", None)
+            if include is not None:
+                self._validate_usecols(include)
+
+            nulls = self.convert_options.get("null_values", set())
+            if not lib.is_list_like(nulls) or not all(
+                isinstance(x, str) for x in nulls
+            ):
+                raise TypeError(
+                    "The 'pyarrow' engine requires all na_values to be strings"
+                ) from err
+
+            raise
+
+        self._read_options = pyarrow_csv.ReadOptions(**self.read_options)
+        self._parse_options = pyarrow_csv.ParseOptions(**self.parse_options)
+
     def _finalize_pandas_output(self, frame: DataFrame) -> DataFrame:
         """
         Processes data read in based on kwargs.
@@ -154,6 +203,15 @@ class ArrowParserWrapper(ParserBase):
         DataFrame
             The processed DataFrame.
         """
+        if (
+            self.header is not None
+            and self.index_col is None
+            and self.dtype is None
+            and not isinstance(self.parse_dates, list)
+        ):
+            # Nothing to rename, convert or set as index
+            return frame
+
         num_cols = len(frame.columns)
         multi_index_named = True
         if self.header is None:
@@ -172,6 +230,7 @@ class ArrowParserWrapper(ParserBase):
         frame = self._do_date_conversions(frame.columns, frame)
         if self.index_col is not None:
             index_to_set = self.index_col.copy()
+            index_dtypes = {}
             for i, item in enumerate(self.index_col):
                 if is_integer(item):
                     index_to_set[i] = frame.columns[item]
@@ -179,7 +238,7 @@ class ArrowParserWrapper(ParserBase):
                 elif item not in frame.columns:
                     raise ValueError(f"Index {item} invalid")
 
-                # Process dtype for index_col and drop from dtypes
+                # Collect dtype for index_col, applied below in one astype
                 if self.dtype is not None:
                     key, new_dtype = (
                         (item, self.dtype.get(item))
@@ -187,8 +246,13 @@ class ArrowParserWrapper(ParserBase):
                         else (frame.columns[item], self.dtype.get(frame.columns[item]))
                     )
                     if new_dtype is not None:
-                        frame[key] = frame[key].astype(new_dtype)
-                        del self.dtype[key]
+                        index_dtypes[key] = new_dtype
+
+            if index_dtypes:
+                frame = frame.astype(index_dtypes)
+                # drop from dtypes so they are not applied again below
+                for key in index_dtypes:
+                    del self.dtype[key]
 
             frame.set_index(index_to_set, drop=True, inplace=True)
             # Clear names if headerless and no name given
@@ -199,13 +263,7 @@ class ArrowParserWrapper(ParserBase):
             # Ignore non-existent columns from dtype mapping
             # like other parsers do
             if isinstance(self.dtype, dict):
-                self.dtype = {
-                    k: pandas_dtype(v)
-                    for k, v in self.dtype.items()
-                    if k in frame.columns
-                }
-            else:
-                self.dtype = pandas_dtype(self.dtype)
+                self.dtype = {k: v for k, v in self.dtype.items() if k in frame.columns}
             try:
                 frame = frame.astype(self.dtype)
             except TypeError as err:
@@ -235,58 +293,76 @@ class ArrowParserWrapper(ParserBase):
         DataFrame
             The DataFrame created from the CSV file.
         """
-        pa = import_optional_dependency("pyarrow")
-        pyarrow_csv = import_optional_dependency("pyarrow.csv")
-        self._get_pyarrow_options()
-
-        try:
-            convert_options = pyarrow_csv.ConvertOptions(**self.convert_options)
-        except TypeError as err:
-            include = self.convert_options.get("include_columns", None)
-            if include is not None:
-                self._validate_usecols(include)
-
-            nulls = self.convert_options.get("null_values", set())
-            if not lib.is_list_like(nulls) or not all(
-                isinstance(x, str) for x in nulls
-            ):
-                raise TypeError(
-                    "The 'pyarrow' engine requires all na_values to be strings"
-                ) from err
-
-            raise
-
+        src = self.src
+        if isinstance(src, _BytesIOWrapper) and isinstance(src.buffer, StringIO):
+            # The text is already in memory, so encode it in one go rather than
+            # letting pyarrow pull small blocks through the wrapper's per-read
+            # encode. Other text handles keep streaming to bound peak memory.
+            src = pa.py_buffer(src.read())
+
+        self._bad_rows.clear()
         try:
             table = pyarrow_csv.read_csv(
-                self.src,
-                read_options=pyarrow_csv.ReadOptions(**self.read_options),
-                parse_options=pyarrow_csv.ParseOptions(**self.parse_options),
-                convert_options=convert_options,
+                src,
+                read_options=self._read_options,
+                parse_options=self._parse_options,
+                convert_options=self._convert_options,
             )
         except pa.ArrowInvalid as e:
             raise ParserError(e) from e
 
+        if self._bad_rows:
+            stacklevel = find_stack_level()
+            for expected_columns, actual_columns, text in self._bad_rows:
+                warnings.warn(
+                    f"Expected {expected_columns} columns, but found "
+                    f"{actual_columns}: {text}",
+                    ParserWarning,
+                    stacklevel=stacklevel,
+                )
+            self._bad_rows.clear()
+
         dtype_backend = self.kwds["dtype_backend"]
 
         # Convert all pa.null() cols -> float64 (non nullable)
         # else Int64 (nullable case, see below)
         if dtype_backend is lib.no_default:
-            new_schema = table.schema
-            new_type = pa.float64()
-            for i, arrow_type in enumerate(table.schema.types):
-                if pa.types.is_null(arrow_type):
-                    new_schema = new_schema.set(
-                        i, new_schema.field(i).with_type(new_type)
-                    )
-
-            table = table.cast(new_schema)
+            # Swap in all-null float64 columns instead of casting the whole
+            # table, collecting the replacements so the table is rebuilt once
+            columns = table.columns
+            fields = list(table.schema)
+            replaced = False
+            for i, field in enumerate(fields):
+                if pa.types.is_null(field.type):
+                    fields[i] = field.with_type(pa.float64())
+                    columns[i] = pa.nulls(table.num_rows, type=pa.float64())
+                    replaced = True
+            if replaced:
+                table = pa.Table.from_arrays(
+                    columns, schema=pa.schema(fields, metadata=table.schema.metadata)
+                )
 
-        with warnings.catch_warnings():
-            warnings.filterwarnings(
-                "ignore",
-                "make_block is deprecated",
-                DeprecationWarning,
+        if dtype_backend == "pyarrow":
+            # Every column ends up as an ArrowExtensionArray anyway, so wrap
+            # the chunked arrays directly instead of going through to_pandas
+            frame = DataFrame._from_arrays(
+                [ArrowExtensionArray(column) for column in table.columns],
+                columns=Index(table.column_names),
+                index=default_index(table.num_rows),
+                verify_integrity=False,
             )
+        elif pa_version_under17p0:
+            # pyarrow < 17 builds the frame through the deprecated make_block
+            with warnings.catch_warnings():
+                warnings.filterwarnings(
+                    "ignore",
+                    "make_block is deprecated",
+                    DeprecationWarning,
+                )
+                frame = arrow_table_to_pandas(
+                    table, dtype_backend=dtype_backend, null_to_int64=True
+                )
+        else:
             frame = arrow_table_to_pandas(
                 table, dtype_backend=dtype_backend, null_to_int64=True
             )
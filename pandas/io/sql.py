@@ -18,7 +18,9 @@ from datetime import (
     datetime,
     time,
 )
+import functools
 from functools import partial
+from itertools import chain
 import re
 from typing import (
     TYPE_CHECKING,
@@ -34,14 +36,20 @@ import numpy as np
 from pandas._config import using_string_dtype
 
 from pandas._libs import lib
-from pandas.compat._optional import import_optional_dependency
+from pandas.compat._optional import (
+    get_version,
+    import_optional_dependency,
+)
 from pandas.errors import (
     AbstractMethodError,
     DatabaseError,
 )
+from pandas.util._decorators import cache_readonly
 from pandas.util._exceptions import find_stack_level
 from pandas.util._validators import check_dtype_backend
+from pandas.util.version import Version
 
+from pandas.core.dtypes.cast import construct_1d_object_array_from_listlike
 from pandas.core.dtypes.common import (
     is_dict_like,
     is_list_like,
@@ -158,10 +166,11 @@ def _convert_arrays_to_dataframe(
     coerce_float: bool = True,
     dtype_backend: DtypeBackend | Literal["numpy"] = "numpy",
 ) -> DataFrame:
-    content = lib.to_object_array_tuples(data)
-    idx_len = content.shape[0]
+    # pivot the fetched rows straight into per-column object arrays instead of
+    # materializing a 2D object array and taking strided views of its transpose
+    idx_len = len(data)
     arrays = convert_object_array(
-        list(content.T),
+        [construct_1d_object_array_from_listlike(col) for col in zip(*data)],
         dtype=None,
         coerce_float=coerce_float,
         dtype_backend=dtype_backend,
@@ -872,6 +881,31 @@ def has_table(table_name: str, con, schema: str | None = None) -> bool:
 table_exists = has_table
 
 
+@functools.lru_cache
+def _adbc_supports_create_append() -> bool:
+    """
+    Whether the installed ADBC drivers accept the "create_append" ingest mode.
+
+    adbc-driver-sqlite before 0.9.0 rejects it, in which case ``to_sql`` falls
+    back to checking for the table before picking "create" or "append".
+    """
+    adbc_sqlite = import_optional_dependency("adbc_driver_sqlite", errors="ignore")
+    if adbc_sqlite is None:
+        return True
+    return Version(get_version(adbc_sqlite)) >= Version("0.9.0")
+
+
+@functools.lru_cache
+def _get_optional_connectable_module(name: str):
+    """
+    Import an optional connectable library once.
+
+    Python does not cache failed imports, so without this every call into
+    pandasSQL_builder would search sys.path again for a missing driver.
+    """
+    return import_optional_dependency(name, errors="ignore")
+
+
 def pandasSQL_builder(
     con,
     schema: str | None = None,
@@ -887,7 +921,7 @@ def pandasSQL_builder(
     if isinstance(con, sqlite3.Connection) or con is None:
         return SQLiteDatabase(con)
 
-    sqlalchemy = import_optional_dependency("sqlalchemy", errors="ignore")
+    sqlalchemy = _get_optional_connectable_module("sqlalchemy")
 
     if isinstance(con, str) and sqlalchemy is None:
         raise ImportError("Using URI string without sqlalchemy installed.")
@@ -895,7 +929,7 @@ def pandasSQL_builder(
     if sqlalchemy is not None and isinstance(con, (str, sqlalchemy.engine.Connectable)):
         return SQLDatabase(con, schema, need_transaction)
 
-    adbc = import_optional_dependency("adbc_driver_manager.dbapi", errors="ignore")
+    adbc = _get_optional_connectable_module("adbc_driver_manager.dbapi")
     if adbc and isinstance(con, adbc.Connection):
         return ADBCDatabase(con)
 
@@ -1052,6 +1086,10 @@ class SQLTable(PandasObject):
                     vals = vals.to_numpy(dtype=np.dtype("m8[ns]"))
                 # store as integers, see GH#6921, GH#7076
                 d = vals.view("i8").astype(object)
+            elif isinstance(ser._values, np.ndarray) and ser.dtype.kind in "iub":
+                # Cannot hold missing values; insert() converts these to Python
+                # scalars with ndarray.tolist, so skip boxing to object here
+                d = ser._values
             else:
                 d = ser._values.astype(object)
 
@@ -1102,7 +1140,9 @@ class SQLTable(PandasObject):
                 if start_i >= end_i:
                     break
 
-                chunk_iter = zip(*(arr[start_i:end_i] for arr in data_list))
+                # tolist converts each column slice in C, so building the
+                # row tuples only iterates plain lists
+                chunk_iter = zip(*(arr[start_i:end_i].tolist() for arr in data_list))
                 num_inserted = exec_insert(conn, keys, chunk_iter)
                 # GH 46891
                 if num_inserted is not None:
@@ -2356,18 +2396,20 @@ class ADBCDatabase(PandasSQL):
             table_name = name
 
         # pandas if_exists="append" will still create the
-        # table if it does not exist; ADBC is more explicit with append/create
-        # as applicable modes, so the semantics get blurred across
-        # the libraries
-        mode = "create"
-        if self.has_table(name, schema):
-            if if_exists == "fail":
-                raise ValueError(f"Table '{table_name}' already exists.")
-            elif if_exists == "replace":
-                with self.con.cursor() as cur:
-                    cur.execute(f"DROP TABLE {table_name}")
-            elif if_exists == "append":
-                mode = "append"
+        # table if it does not exist, which maps onto ADBC's "create_append"
+        # mode and lets the driver skip the has_table round trip
+        if if_exists == "append" and _adbc_supports_create_append():
+            mode = "create_append"
+        else:
+            mode = "create"
+            if self.has_table(name, schema):
+                if if_exists == "fail":
+                    raise ValueError(f"Table '{table_name}' already exists.")
+                elif if_exists == "replace":
+                    with self.con.cursor() as cur:
+                        cur.execute(f"DROP TABLE {table_name}")
+                elif if_exists == "append":
+                    mode = "append"
 
         import pyarrow as pa
 
@@ -2500,7 +2542,10 @@ class SQLiteTable(SQLTable):
             for stmt in self.table:
                 conn.execute(stmt)
 
-    def insert_statement(self, *, num_rows: int) -> str:
+    @cache_readonly
+    def _insert_statement_parts(self) -> tuple[str, str]:
+        # The "INSERT INTO ... VALUES " prefix and the wildcards of one row,
+        # computed once and reused for every chunk
         names = list(map(str, self.frame.columns))
         wld = "?"  # wildcard char
         escape = _get_valid_sqlite_name
@@ -2513,11 +2558,12 @@ class SQLiteTable(SQLTable):
         col_names = ",".join(bracketed_names)
 
         row_wildcards = ",".join([wld] * len(names))
-        wildcards = ",".join([f"({row_wildcards})" for _ in range(num_rows)])
-        insert_statement = (
-            f"INSERT INTO {escape(self.name)} ({col_names}) VALUES {wildcards}"
-        )
-        return insert_statement
+        prefix = f"INSERT INTO {escape(self.name)} ({col_names}) VALUES "
+        return prefix, f"({row_wildcards})"
+
+    def insert_statement(self, *, num_rows: int) -> str:
+        prefix, row_wildcards = self._insert_statement_parts
+        return prefix + ",".join([row_wildcards] * num_rows)
 
     def _execute_insert(self, conn, keys, data_iter) -> int:
         data_list = list(data_iter)
@@ -2526,7 +2572,7 @@ class SQLiteTable(SQLTable):
 
     def _execute_insert_multi(self, conn, keys, data_iter) -> int:
         data_list = list(data_iter)
-        flattened_data = [x for row in data_list for x in row]
+        flattened_data = list(chain.from_iterable(data_list))
         conn.execute(self.insert_statement(num_rows=len(data_list)), flattened_data)
         return conn.rowcount
 
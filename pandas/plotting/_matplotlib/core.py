@@ -98,6 +98,10 @@ if TYPE_CHECKING:
         Series,
     )
 
+_mpl_version = Version(mpl.__version__)
+_mpl_lt_3_7 = _mpl_version < Version("3.7")
+_mpl_lt_3_8 = _mpl_version < Version("3.8")
+
 
 def holds_integer(column: Index) -> bool:
     return column.inferred_type in {"integer", "mixed-integer"}
@@ -872,7 +876,7 @@ class MPLPlot(ABC):
             if leg is not None:
                 title = leg.get_title().get_text()
                 # Replace leg.legend_handles because it misses marker info
-                if Version(mpl.__version__) < Version("3.7"):
+                if _mpl_lt_3_7:
                     handles = leg.legendHandles
                 else:
                     handles = leg.legend_handles
@@ -1213,7 +1217,7 @@ class MPLPlot(ABC):
 
     @final
     def _get_subplots(self, fig: Figure) -> list[Axes]:
-        if Version(mpl.__version__) < Version("3.8"):
+        if _mpl_lt_3_8:
             Klass = mpl.axes.Subplot
         else:
             Klass = mpl.axes.Axes
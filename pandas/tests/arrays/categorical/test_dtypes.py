@@ -100,20 +100,21 @@ class TestCategoricalDtypes:
         result = Categorical(["foo", "bar", "baz"])
         assert result.codes.dtype == "int8"
 
-        result = Categorical([f"foo{i:05d}" for i in range(400)])
+        cats = np.char.add("foo", np.char.zfill(np.arange(40000).astype(str), 5))
+        result = Categorical(cats[:400])
         assert result.codes.dtype == "int16"
 
-        result = Categorical([f"foo{i:05d}" for i in range(40000)])
+        result = Categorical(cats)
         assert result.codes.dtype == "int32"
 
         # adding cats
         result = Categorical(["foo", "bar", "baz"])
         assert result.codes.dtype == "int8"
-        result = result.add_categories([f"foo{i:05d}" for i in range(400)])
+        result = result.add_categories(cats[:400])
         assert result.codes.dtype == "int16"
 
         # removing cats
-        result = result.remove_categories([f"foo{i:05d}" for i in range(300)])
+        result = result.remove_categories(cats[:300])
         assert result.codes.dtype == "int8"
 
     def test_iter_python_types(self):
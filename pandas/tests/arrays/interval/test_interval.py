@@ -51,9 +51,11 @@ class TestAttributes:
     @pytest.mark.parametrize("constructor", [IntervalArray, IntervalIndex])
     def test_is_empty(self, constructor, left, right, closed):
         # GH27219
-        tuples = [(left, left), (left, right), np.nan]
+        left_values = [left, left, np.nan]
+        right_values = [left, right, np.nan]
         expected = np.array([closed != "both", False, False])
-        result = constructor.from_tuples(tuples, closed=closed).is_empty
+        result = constructor.from_arrays(left_values, right_values, closed=closed)
+        result = result.is_empty
         tm.assert_numpy_array_equal(result, expected)
 
 
@@ -133,8 +135,8 @@ class TestSetitem:
 
         result[0] = np.nan
 
-        expected_left = Index([left._na_value] + list(left[1:]))
-        expected_right = Index([right._na_value] + list(right[1:]))
+        expected_left = left[1:].insert(0, left._na_value)
+        expected_right = right[1:].insert(0, right._na_value)
         expected = IntervalArray.from_arrays(expected_left, expected_right)
 
         tm.assert_extension_array_equal(result, expected)
@@ -1,10 +1,13 @@
 import numpy as np
 import pytest
 
+import pandas.util._test_decorators as td
+
 from pandas.core.dtypes.common import is_integer_dtype
 
 import pandas as pd
 import pandas._testing as tm
+from pandas.core.array_algos import masked_reductions
 from pandas.core.arrays import BaseMaskedArray
 
 arrays = [pd.array([1, 2, 3, None], dtype=dtype) for dtype in tm.ALL_INT_EA_DTYPES]
@@ -72,3 +75,33 @@ def test_to_numpy():
     result = arr.to_numpy()
     expected = np.array(["a", pd.NA, "c"])
     tm.assert_numpy_array_equal(result, expected)
+
+
+@td.skip_if_no("numba")
+@pytest.mark.parametrize(
+    "values", [[1, 2, None, 4, None], [2, None], [None, None, None], []]
+)
+@pytest.mark.parametrize("min_count", [0, 1, 3])
+def test_sum_use_numba(monkeypatch, values, min_count):
+    # lower the length gate so these small arrays reach the numba kernel
+    monkeypatch.setattr(masked_reductions, "_NUMBA_MIN_ELEMENTS", 0)
+    arr = pd.array(values, dtype="Int64")
+    expected = arr.sum(min_count=min_count)
+    with pd.option_context("compute.use_numba", True):
+        result = arr.sum(min_count=min_count)
+    tm.assert_almost_equal(result, expected)
+    assert type(result) is type(expected)
+
+
+@td.skip_if_no("numba")
+def test_sum_use_numba_large():
+    rng = np.random.default_rng(2)
+    n = masked_reductions._NUMBA_MIN_ELEMENTS + 1
+    arr = pd.array(rng.integers(-(10**12), 10**12, n), dtype="Int64")
+    arr[rng.integers(0, n, 1000)] = pd.NA
+
+    expected = arr.sum()
+    with pd.option_context("compute.use_numba", True):
+        result = arr.sum()
+    assert result == expected
+    assert type(result) is type(expected)
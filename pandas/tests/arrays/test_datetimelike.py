@@ -33,13 +33,13 @@ from pandas.core.arrays import (
 
 
 # TODO: more freq variants
-@pytest.fixture(params=["D", "B", "W", "ME", "QE", "YE"])
+@pytest.fixture(params=["D", "B", "W", "ME", "QE", "YE"], scope="module")
 def freqstr(request):
     """Fixture returning parametrized frequency in string format."""
     return request.param
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def period_index(freqstr):
     """
     A fixture to provide PeriodIndex objects with different frequencies.
@@ -59,7 +59,7 @@ def period_index(freqstr):
     return pi
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def datetime_index(freqstr):
     """
     A fixture to provide DatetimeIndex objects with different frequencies.
@@ -174,13 +174,13 @@ class SharedTests:
         result = arr.take(takers)
         expected = idx.take(takers)
 
-        tm.assert_index_equal(self.index_cls(result), expected)
+        tm.assert_extension_array_equal(result, expected._data)
 
         takers = np.array([1, 4, 94])
         result = arr.take(takers)
         expected = idx.take(takers)
 
-        tm.assert_index_equal(self.index_cls(result), expected)
+        tm.assert_extension_array_equal(result, expected._data)
 
     @pytest.mark.parametrize("fill_value", [2, 2.0, Timestamp(2021, 1, 1, 12).time])
     def test_take_fill_raises(self, fill_value, arr1d):
@@ -223,7 +223,7 @@ class SharedTests:
         arr2 = arr.astype(object)
         expected = self.index_cls(np.concatenate([arr2[:-1], arr2[1:], arr2]))
 
-        tm.assert_index_equal(self.index_cls(result), expected)
+        tm.assert_extension_array_equal(result, expected._data)
 
     def test_unbox_scalar(self, arr1d):
         result = arr1d._unbox_scalar(arr1d[0])
@@ -747,6 +747,8 @@ class TestDatetimeArray(SharedTests):
         dta = DatetimeArray._from_sequence(arr[:0], dtype=arr.dtype)
         assert dta._ndarray.base is arr
 
+    # the tz only feeds the 5-element arr1d construction here
+    @pytest.mark.parametrize("tz_naive_fixture", [None, "UTC", "US/Eastern"])
     def test_from_dti(self, arr1d):
         arr = arr1d
         dti = self.index_cls(arr1d)
@@ -755,8 +757,9 @@ class TestDatetimeArray(SharedTests):
         # Check that Index.__new__ knows what to do with DatetimeArray
         dti2 = pd.Index(arr)
         assert isinstance(dti2, DatetimeIndex)
-        assert list(dti2) == list(arr)
+        tm.assert_index_equal(dti2, dti)
 
+    @pytest.mark.parametrize("tz_naive_fixture", [None, "UTC", "US/Eastern"])
     def test_astype_object(self, arr1d):
         arr = arr1d
         dti = self.index_cls(arr1d)
@@ -764,7 +767,7 @@ class TestDatetimeArray(SharedTests):
         asobj = arr.astype("O")
         assert isinstance(asobj, np.ndarray)
         assert asobj.dtype == "O"
-        assert list(asobj) == list(dti)
+        tm.assert_numpy_array_equal(asobj, np.asarray(dti, dtype=object))
 
     @pytest.mark.filterwarnings(r"ignore:PeriodDtype\[B\] is deprecated:FutureWarning")
     def test_to_period(self, datetime_index, freqstr):
@@ -924,7 +927,7 @@ class TestTimedeltaArray(SharedTests):
         # Check that Index.__new__ knows what to do with TimedeltaArray
         tdi2 = pd.Index(arr)
         assert isinstance(tdi2, TimedeltaIndex)
-        assert list(tdi2) == list(arr)
+        tm.assert_index_equal(tdi2, tdi)
 
     def test_astype_object(self):
         tdi = TimedeltaIndex(["1 Day", "3 Hours"])
@@ -932,7 +935,7 @@ class TestTimedeltaArray(SharedTests):
         asobj = arr.astype("O")
         assert isinstance(asobj, np.ndarray)
         assert asobj.dtype == "O"
-        assert list(asobj) == list(tdi)
+        tm.assert_numpy_array_equal(asobj, np.asarray(tdi, dtype=object))
 
     def test_to_pytimedelta(self, timedelta_index):
         tdi = timedelta_index
@@ -1045,7 +1048,8 @@ class TestPeriodArray(SharedTests):
         """
         Fixture returning DatetimeArray from parametrized PeriodIndex objects
         """
-        return period_index._data
+        # period_index is shared across the module; tests may setitem on arr1d
+        return period_index._data.copy()
 
     def test_from_pi(self, arr1d):
         pi = self.index_cls(arr1d)
@@ -1055,7 +1059,7 @@ class TestPeriodArray(SharedTests):
         # Check that Index.__new__ knows what to do with PeriodArray
         pi2 = pd.Index(arr)
         assert isinstance(pi2, PeriodIndex)
-        assert list(pi2) == list(arr)
+        tm.assert_index_equal(pi2, pi)
 
     def test_astype_object(self, arr1d):
         pi = self.index_cls(arr1d)
@@ -1063,7 +1067,7 @@ class TestPeriodArray(SharedTests):
         asobj = arr.astype("O")
         assert isinstance(asobj, np.ndarray)
         assert asobj.dtype == "O"
-        assert list(asobj) == list(pi)
+        tm.assert_numpy_array_equal(asobj, np.asarray(pi, dtype=object))
 
     def test_take_fill_valid(self, arr1d):
         arr = arr1d
@@ -12,11 +12,12 @@ from pandas._libs.tslibs import NaT
 
 from pandas.core.dtypes.cast import maybe_promote
 from pandas.core.dtypes.common import is_scalar
-from pandas.core.dtypes.dtypes import DatetimeTZDtype
 from pandas.core.dtypes.missing import isna
 
 import pandas as pd
 
+_FLOAT32_MAX = float(np.finfo("float32").max)
+
 
 def _check_promote(dtype, fill_value, expected_dtype, exp_val_for_scalar=None):
     """
@@ -188,7 +189,7 @@ def test_maybe_promote_int_with_int(dtype, fill_value, expected_dtype):
     expected_dtype = np.dtype(expected_dtype)
 
     # output is not a generic int, but corresponds to expected_dtype
-    exp_val_for_scalar = np.array([fill_value], dtype=expected_dtype)[0]
+    exp_val_for_scalar = expected_dtype.type(fill_value)
 
     _check_promote(dtype, fill_value, expected_dtype, exp_val_for_scalar)
 
@@ -198,7 +199,7 @@ def test_maybe_promote_int_with_float(any_int_numpy_dtype, float_numpy_dtype):
     fill_dtype = np.dtype(float_numpy_dtype)
 
     # create array of given dtype; casts "1" to correct dtype
-    fill_value = np.array([1], dtype=fill_dtype)[0]
+    fill_value = fill_dtype.type(1)
 
     # filling int with float always upcasts to float64
     expected_dtype = np.float64
@@ -213,13 +214,13 @@ def test_maybe_promote_float_with_int(float_numpy_dtype, any_int_numpy_dtype):
     fill_dtype = np.dtype(any_int_numpy_dtype)
 
     # create array of given dtype; casts "1" to correct dtype
-    fill_value = np.array([1], dtype=fill_dtype)[0]
+    fill_value = fill_dtype.type(1)
 
     # filling float with int always keeps float dtype
     # because: np.finfo('float32').max > np.iinfo('uint64').max
     expected_dtype = dtype
     # output is not a generic float, but corresponds to expected_dtype
-    exp_val_for_scalar = np.array([fill_value], dtype=expected_dtype)[0]
+    exp_val_for_scalar = expected_dtype.type(fill_value)
 
     _check_promote(dtype, fill_value, expected_dtype, exp_val_for_scalar)
 
@@ -229,24 +230,24 @@ def test_maybe_promote_float_with_int(float_numpy_dtype, any_int_numpy_dtype):
     [
         # float filled with float
         ("float32", 1, "float32"),
-        ("float32", float(np.finfo("float32").max) * 1.1, "float64"),
+        ("float32", _FLOAT32_MAX * 1.1, "float64"),
         ("float64", 1, "float64"),
-        ("float64", float(np.finfo("float32").max) * 1.1, "float64"),
+        ("float64", _FLOAT32_MAX * 1.1, "float64"),
         # complex filled with float
         ("complex64", 1, "complex64"),
-        ("complex64", float(np.finfo("float32").max) * 1.1, "complex128"),
+        ("complex64", _FLOAT32_MAX * 1.1, "complex128"),
         ("complex128", 1, "complex128"),
-        ("complex128", float(np.finfo("float32").max) * 1.1, "complex128"),
+        ("complex128", _FLOAT32_MAX * 1.1, "complex128"),
         # float filled with complex
         ("float32", 1 + 1j, "complex64"),
-        ("float32", float(np.finfo("float32").max) * (1.1 + 1j), "complex128"),
+        ("float32", _FLOAT32_MAX * (1.1 + 1j), "complex128"),
         ("float64", 1 + 1j, "complex128"),
-        ("float64", float(np.finfo("float32").max) * (1.1 + 1j), "complex128"),
+        ("float64", _FLOAT32_MAX * (1.1 + 1j), "complex128"),
         # complex filled with complex
         ("complex64", 1 + 1j, "complex64"),
-        ("complex64", float(np.finfo("float32").max) * (1.1 + 1j), "complex128"),
+        ("complex64", _FLOAT32_MAX * (1.1 + 1j), "complex128"),
         ("complex128", 1 + 1j, "complex128"),
-        ("complex128", float(np.finfo("float32").max) * (1.1 + 1j), "complex128"),
+        ("complex128", _FLOAT32_MAX * (1.1 + 1j), "complex128"),
     ],
 )
 def test_maybe_promote_float_with_float(dtype, fill_value, expected_dtype):
@@ -254,7 +255,7 @@ def test_maybe_promote_float_with_float(dtype, fill_value, expected_dtype):
     expected_dtype = np.dtype(expected_dtype)
 
     # output is not a generic float, but corresponds to expected_dtype
-    exp_val_for_scalar = np.array([fill_value], dtype=expected_dtype)[0]
+    exp_val_for_scalar = expected_dtype.type(fill_value)
 
     _check_promote(dtype, fill_value, expected_dtype, exp_val_for_scalar)
 
@@ -280,7 +281,7 @@ def test_maybe_promote_any_with_bool(any_numpy_dtype):
     # filling anything but bool with bool casts to object
     expected_dtype = np.dtype(object) if dtype != bool else dtype
     # output is not a generic bool, but corresponds to expected_dtype
-    exp_val_for_scalar = np.array([fill_value], dtype=expected_dtype)[0]
+    exp_val_for_scalar = expected_dtype.type(fill_value)
 
     _check_promote(dtype, fill_value, expected_dtype, exp_val_for_scalar)
 
@@ -308,7 +309,7 @@ def test_maybe_promote_any_with_bytes(any_numpy_dtype):
     # we never use bytes dtype internally, always promote to object
     expected_dtype = np.dtype(np.object_)
     # output is not a generic bytes, but corresponds to expected_dtype
-    exp_val_for_scalar = np.array([fill_value], dtype=expected_dtype)[0]
+    exp_val_for_scalar = expected_dtype.type(fill_value)
 
     _check_promote(dtype, fill_value, expected_dtype, exp_val_for_scalar)
 
@@ -335,10 +336,10 @@ def test_maybe_promote_datetime64_with_any(datetime64_dtype, any_numpy_dtype):
 @pytest.mark.parametrize(
     "fill_value",
     [
-        pd.Timestamp("now"),
-        np.datetime64("now"),
-        datetime.datetime.now(),
-        datetime.date.today(),
+        pd.Timestamp("2020-01-02 03:04:05.678901"),
+        np.datetime64("2020-01-02T03:04:05"),
+        datetime.datetime(2020, 1, 2, 3, 4, 5),
+        datetime.date(2020, 1, 2),
     ],
     ids=["pd.Timestamp", "np.datetime64", "datetime.datetime", "datetime.date"],
 )
@@ -376,9 +377,7 @@ def test_maybe_promote_any_numpy_dtype_with_datetimetz(
     any_numpy_dtype, tz_aware_fixture, fill_value
 ):
     dtype = np.dtype(any_numpy_dtype)
-    fill_dtype = DatetimeTZDtype(tz=tz_aware_fixture)
-
-    fill_value = pd.Series([fill_value], dtype=fill_dtype)[0]
+    fill_value = pd.Timestamp(fill_value).tz_localize(tz_aware_fixture)
 
     # filling any numpy dtype with datetimetz casts to object
     expected_dtype = np.dtype(object)